@@ -3,7 +3,9 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 
 import io
+import os
 import json
+from pathlib import Path
 from typing import Dict, TypedDict, NewType, TYPE_CHECKING
 
 from utils import json_load, json_save
@@ -50,7 +52,8 @@ class ImageCache:
         self._root = manager._root
         self._twitch = manager._twitch
         cleanup: bool = False
-        CACHE_PATH.mkdir(parents=True, exist_ok=True)
+        cache_path = Path(CACHE_PATH)
+        cache_path.mkdir(parents=True, exist_ok=True)
         try:
             self._hashes: Hashes = json_load(CACHE_DB, default_database, merge=False)
         except json.JSONDecodeError:
@@ -77,15 +80,15 @@ class ImageCache:
         for img_hash, count in hash_counts.items():
             if count == 0:
                 # hashes come with an extension already
-                CACHE_PATH.joinpath(img_hash).unlink(missing_ok=True)
+                cache_path.joinpath(img_hash).unlink(missing_ok=True)
                 # NOTE: The hashes are deleted from self._hashes above
         if cleanup:
             # This cleanups the cache folder from unused PNG files
             orphans = [
-                file.name for file in CACHE_PATH.glob("*.png") if file.name not in hash_counts
+                file.name for file in cache_path.glob("*.png") if file.name not in hash_counts
             ]
             for filename in orphans:
-                CACHE_PATH.joinpath(filename).unlink(missing_ok=True)
+                cache_path.joinpath(filename).unlink(missing_ok=True)
 
     def save(self, *, force: bool = False) -> None:
         if self._altered or force:
@@ -110,7 +113,9 @@ class ImageCache:
                     image = self._images[img_hash]
                 else:
                     try:
-                        self._images[img_hash] = image = Image_module.open(CACHE_PATH / img_hash)
+                        self._images[img_hash] = image = Image_module.open(
+                            os.path.join(CACHE_PATH, img_hash)
+                        )
                     except FileNotFoundError:
                         pass
             if image is None:
@@ -118,7 +123,7 @@ class ImageCache:
                     image = Image_module.open(io.BytesIO(await response.read()))
                 img_hash = self._hash(image)
                 self._images[img_hash] = image
-                image.save(CACHE_PATH / img_hash)
+                image.save(os.path.join(CACHE_PATH, img_hash))
                 self._hashes[url] = {
                     "hash": img_hash,
                     "expires": self._new_expires()
@@ -247,7 +247,7 @@ class Channel:
     async def get_stream(self) -> Stream | None:
         try:
             response: JsonType = await self._twitch.gql_request(
-                GQL_OPERATIONS["GetStreamInfo"].with_variables({"channel": self._login})
+                GQL_OPERATIONS["GetStreamInfo"].render(channel=self._login)
             )
         except MinerException as exc:
             raise MinerException(f"Channel: {self._login}") from exc
@@ -263,7 +263,7 @@ class Channel:
         if not stream.drops_enabled:
             try:
                 available_drops: JsonType = await self._twitch.gql_request(
-                    GQL_OPERATIONS["AvailableDrops"].with_variables({"channelID": str(self.id)})
+                    GQL_OPERATIONS["AvailableDrops"].render(channelID=str(self.id))
                 )
             except MinerException:
                 logger.log(CALL, f"AvailableDrops GQL call failed for channel: {self._login}")
@@ -340,7 +340,7 @@ class Channel:
         This claims bonus points if they're available, and fills out the 'points' attribute.
         """
         response: JsonType = await self._twitch.gql_request(
-            GQL_OPERATIONS["ChannelPointsContext"].with_variables({"channelLogin": self._login})
+            GQL_OPERATIONS["ChannelPointsContext"].render(channelLogin=self._login)
         )
         channel_data: JsonType = response["data"]["community"]["channel"]
         self.points = channel_data["self"]["communityPoints"]["balance"]
@@ -383,7 +383,7 @@ class Channel:
         """
         try:
             response: JsonType = await self._twitch.gql_request(        # Gets signature and value
-                GQL_OPERATIONS["PlaybackAccessToken"].with_variables({"login": self._login})
+                GQL_OPERATIONS["PlaybackAccessToken"].render(login=self._login)
                 )
         except MinerException as exc:
             raise MinerException(f"Channel: {self._login}") from exc
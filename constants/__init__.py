@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+import logging
+from datetime import timedelta
+from typing import Any, Final, NewType, TYPE_CHECKING
+
+from version import __version__
+from .paths import (  # noqa
+    IS_APPIMAGE, IS_PACKAGED, SYS_SITE_PACKAGES, SELF_PATH, WORKING_DIR, _resource_path, _PATHS
+)
+
+if TYPE_CHECKING:
+    from collections import abc  # noqa
+    from typing_extensions import TypeAlias
+
+    from .paths import (  # noqa
+        VENV_PATH,
+        SITE_PACKAGES_PATH,
+        LANG_PATH,
+        LOG_PATH,
+        CACHE_PATH,
+        LOCK_PATH,
+        CACHE_DB,
+        COOKIES_PATH,
+        SETTINGS_PATH,
+    )
+    from .gql import GQL_OPERATIONS, GQLOperation  # noqa
+    from .clients import ClientInfo, ClientType  # noqa
+    from .websocket import WEBSOCKET_TOPICS, WebsocketTopic  # noqa
+
+
+# logging special levels
+CALL = logging.INFO - 1
+logging.addLevelName(CALL, "CALL")
+
+
+class _FileFormatter(logging.Formatter):
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        # appends the milliseconds here, using int formatting
+        created = time.strftime(datefmt or "%Y-%m-%d %H:%M:%S", self.converter(record.created))
+        return "%s.%03d" % (created, int(record.msecs))
+
+
+# Typing
+JsonType = dict[str, Any]
+URLType = NewType("URLType", str)
+TopicProcess: TypeAlias = "abc.Callable[[int, JsonType], Any]"
+# Values
+BASE_TOPICS = 3
+MAX_WEBSOCKETS = 8
+WS_TOPICS_LIMIT = 50
+TOPICS_PER_CHANNEL = 2
+MAX_TOPICS = (MAX_WEBSOCKETS * WS_TOPICS_LIMIT) - BASE_TOPICS
+MAX_CHANNELS = MAX_TOPICS // TOPICS_PER_CHANNEL
+# Misc
+DEFAULT_LANG = "English"
+# Intervals and Delays
+PING_INTERVAL = timedelta(minutes=3)
+PING_TIMEOUT = timedelta(seconds=10)
+ONLINE_DELAY = timedelta(seconds=120)
+WATCH_INTERVAL = timedelta(seconds=20)
+# Strings
+WINDOW_TITLE = f"Twitch Drops Miner v{__version__} (by DevilXD)"
+# Logging
+FILE_FORMATTER = _FileFormatter(
+    "{asctime}:\t{levelname:>7}:\t{message}",
+    style='{',
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+OUTPUT_FORMATTER = logging.Formatter("{levelname}: {message}", style='{', datefmt="%H:%M:%S")
+
+
+class State:
+    # NOTE: Plain ints instead of an Enum, for cheap comparisons within the main loop
+    IDLE: Final[int] = 0
+    INVENTORY_FETCH: Final[int] = 1
+    GAMES_UPDATE: Final[int] = 2
+    CHANNELS_FETCH: Final[int] = 3
+    CHANNELS_CLEANUP: Final[int] = 4
+    CHANNEL_SWITCH: Final[int] = 5
+    EXIT: Final[int] = 6
+
+
+_STATE_NAMES: tuple[str, ...] = (
+    "IDLE",
+    "INVENTORY_FETCH",
+    "GAMES_UPDATE",
+    "CHANNELS_FETCH",
+    "CHANNELS_CLEANUP",
+    "CHANNEL_SWITCH",
+    "EXIT",
+)
+
+
+def state_name(state: int) -> str:
+    return _STATE_NAMES[state]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 - the heavier constants live in submodules, imported only once needed
+    module: Any
+    if name in _PATHS:
+        from . import paths as module
+    elif name in ("GQL_OPERATIONS", "GQLOperation"):
+        from . import gql as module
+    elif name in ("ClientInfo", "ClientType"):
+        from . import clients as module
+    elif name in ("WEBSOCKET_TOPICS", "WebsocketTopic"):
+        from . import websocket as module
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache into the module's namespace, so that later accesses don't even get here
+    value = globals()[name] = getattr(module, name)
+    return value
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from functools import cached_property
+
+from yarl import URL
+
+
+class ClientInfo:
+    # NOTE: '__dict__' is needed for the cached_property to work
+    __slots__ = ("CLIENT_URL", "CLIENT_ID", "_uas", "__dict__")
+
+    def __init__(self, client_url: URL, client_id: str, user_agents: str | list[str]) -> None:
+        self.CLIENT_URL: URL = client_url
+        self.CLIENT_ID: str = client_id
+        self._uas: str | tuple[str, ...] = (
+            tuple(user_agents) if isinstance(user_agents, list) else user_agents
+        )
+
+    def _pick_user_agent(self) -> str:
+        if isinstance(self._uas, tuple):
+            import random
+            return self._uas[random.randrange(len(self._uas))]
+        return self._uas
+
+    @cached_property
+    def USER_AGENT(self) -> str:
+        # the user agent is picked only once it's actually needed
+        return self._pick_user_agent()
+
+    def rotate_user_agent(self) -> None:
+        # picks a new user agent, if there's more than one to choose from
+        self.USER_AGENT = self._pick_user_agent()
+
+    def __iter__(self):
+        return iter((self.CLIENT_URL, self.CLIENT_ID, self.USER_AGENT))
+
+
+class ClientType:
+    WEB = ClientInfo(
+        URL("https://www.twitch.tv"),
+        "kimne78kx3ncx6brgo4mv6wki5h1ko",
+        (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+        ),
+    )
+    MOBILE_WEB = ClientInfo(
+        URL("https://m.twitch.tv"),
+        "r8s4dac0uhzifbpu9sjdiwzctle17ff",
+        [
+            (
+                "Mozilla/5.0 (Linux; Android 13) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/119.0.6045.66 Mobile Safari/537.36"
+            ),
+            (
+                "Mozilla/5.0 (Linux; Android 13; SM-A205U) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/119.0.6045.66 Mobile Safari/537.36"
+            ),
+            (
+                "Mozilla/5.0 (Linux; Android 13; SM-A102U) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/119.0.6045.66 Mobile Safari/537.36"
+            ),
+            (
+                "Mozilla/5.0 (Linux; Android 13; SM-G960U) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/119.0.6045.66 Mobile Safari/537.36"
+            ),
+            (
+                "Mozilla/5.0 (Linux; Android 13; SM-N960U) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/119.0.6045.66 Mobile Safari/537.36"
+            ),
+            (
+                "Mozilla/5.0 (Linux; Android 13; LM-Q720) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/119.0.6045.66 Mobile Safari/537.36"
+            ),
+            (
+                "Mozilla/5.0 (Linux; Android 13; LM-X420) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/119.0.6045.66 Mobile Safari/537.36"
+            ),
+        ]
+    )
+    ANDROID_APP = ClientInfo(
+        URL("https://www.twitch.tv"),
+        "kd1unb4b3q4t58fwlpcbzcbnm76a8fp",
+        (
+            "Dalvik/2.1.0 (Linux; U; Android 7.1.2; SM-G977N Build/LMY48Z) "
+            "tv.twitch.android.app/16.8.1/1608010"
+        ),
+    )
+    SMARTBOX = ClientInfo(
+        URL("https://android.tv.twitch.tv"),
+        "ue6666qo983tsx6so1t0vnawi233wa",
+        (
+            "Mozilla/5.0 (Linux; Android 7.1; Smart Box C1) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+        ),
+    )
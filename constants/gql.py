@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import json
+from types import MappingProxyType
+from collections import abc
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import JsonType
+
+    GQL_OPERATIONS: abc.Mapping[str, GQLOperation]
+
+
+_PQ_VERSION = 1
+# sha256 -> shared 'extensions' dict
+_EXTENSIONS_CACHE: dict[str, JsonType] = {}
+
+
+def _copy_vars(vars: JsonType) -> JsonType:
+    # copies only the nested dicts, as those are the only thing that gets modified
+    return {k: (_copy_vars(v) if isinstance(v, dict) else v) for k, v in vars.items()}
+
+
+def _find_unset(vars: JsonType) -> tuple[tuple[str, ...], ...]:
+    # returns key paths to all ellipsis (unset) values within the vars
+    unset: list[tuple[str, ...]] = []
+    stack: list[tuple[tuple[str, ...], JsonType]] = [((), vars)]
+    while stack:
+        path, current = stack.pop()
+        for k, v in current.items():
+            if v is Ellipsis:
+                unset.append((*path, k))
+            elif isinstance(v, dict):
+                stack.append(((*path, k), v))
+    return tuple(unset)
+
+
+def _persisted_query(sha256: str) -> JsonType:
+    # NOTE: 'extensions' is never mutated, so operations with the same hash can share it
+    extensions = _EXTENSIONS_CACHE.get(sha256)
+    if extensions is None:
+        extensions = _EXTENSIONS_CACHE[sha256] = {
+            "persistedQuery": {
+                "version": _PQ_VERSION,
+                "sha256Hash": sha256,
+            }
+        }
+    return extensions
+
+
+class GQLOperation:
+    __slots__ = (
+        "operation_name", "sha256", "variables", "_payload", "_unset", "_template", "_slots"
+    )
+
+    def __init__(self, name: str, sha256: str, *, variables: JsonType | None = None):
+        self.operation_name: str = name
+        self.sha256: str = sha256
+        self.variables: JsonType | None = variables
+        self._payload: JsonType | None = None
+        # paths to the variables that have to be specified when sending this operation,
+        # found once here, instead of on every render
+        self._unset: tuple[tuple[str, ...], ...] = ()
+        if variables is not None:
+            self._unset = _find_unset(variables)
+        # pre-serialized JSON body, see compile_template
+        self._template: bytes | None = None
+        self._slots: dict[str, bytes] = {}
+
+    def __repr__(self) -> str:
+        return f"GQLOperation({self.to_payload()!r})"
+
+    def to_payload(self) -> JsonType:
+        """
+        Return the JSON-serializable request payload of this operation.
+        """
+        if self._payload is None:
+            payload: JsonType = {
+                "operationName": self.operation_name,
+                "extensions": _persisted_query(self.sha256),
+            }
+            if self.variables is not None:
+                payload["variables"] = self.variables
+            self._payload = payload
+        return self._payload
+
+    def compile_template(self) -> None:
+        """
+        Serialize this operation into a JSON body once, leaving a unique marker
+        in place of every unset variable, to be filled out by `render`.
+        """
+        payload: JsonType = self.to_payload()
+        slots: dict[str, bytes] = {}
+        if self._unset:
+            assert self.variables is not None
+            variables: JsonType = _copy_vars(self.variables)
+            for path in self._unset:
+                name = path[-1]
+                if name in slots:
+                    raise RuntimeError(f"Ambiguous variable: '{name}'")
+                parent: JsonType = variables
+                for k in path[:-1]:
+                    parent = parent[k]
+                marker = parent[name] = f"\0SLOT:{name}\0"
+                slots[name] = json.dumps(marker).encode()
+            payload = {**payload, "variables": variables}
+        self._slots = slots
+        self._template = json.dumps(payload, separators=(',', ':')).encode()
+
+    def render(self, **variables: Any) -> bytes:
+        """
+        Return the JSON body of this operation, with the unset variables filled out.
+        """
+        if self._template is None:
+            self.compile_template()
+            assert self._template is not None
+        rendered: bytes = self._template
+        for name, slot in self._slots.items():
+            if name not in variables:
+                raise RuntimeError(f"Unspecified variable: '{name}'")
+            rendered = rendered.replace(
+                slot, json.dumps(variables[name], separators=(',', ':')).encode()
+            )
+        if len(variables) > len(self._slots):
+            extra = next(name for name in variables if name not in self._slots)
+            raise RuntimeError(f"Unknown variable: '{extra}'")
+        return rendered
+
+
+# name -> (operation name, sha256 hash, variables template)
+_GQL_SPECS: tuple[tuple[str, tuple[str, str, JsonType | None]], ...] = (
+    # retuns PlaybackAccessToken_Template, for fix 2024/5
+    ("PlaybackAccessToken", (
+        "PlaybackAccessToken",
+        "3093517e37e4f4cb48906155bcd894150aef92617939236d2508f3375ab732ce",
+        {
+            "isLive": True,
+            "login": ...,  # channel login
+            "isVod": False,
+            "vodID": "",
+            "playerType": "site"
+        },
+    )),
+    # returns stream information for a particular channel
+    ("GetStreamInfo", (
+        "VideoPlayerStreamInfoOverlayChannel",
+        "a5f2e34d626a9f4f5c0204f910bab2194948a9502089be558bb6e779a9e1b3d2",
+        {
+            "channel": ...,  # channel login
+        },
+    )),
+    # can be used to claim channel points
+    ("ClaimCommunityPoints", (
+        "ClaimCommunityPoints",
+        "46aaeebe02c99afdf4fc97c7c0cba964124bf6b0af229395f1f6d1feed05b3d0",
+        {
+            "input": {
+                "claimID": ...,  # points claim_id
+                "channelID": ...,  # channel ID as a str
+            },
+        },
+    )),
+    # can be used to claim a drop
+    ("ClaimDrop", (
+        "DropsPage_ClaimDropRewards",
+        "a455deea71bdc9015b78eb49f4acfbce8baa7ccbedd28e549bb025bd0f751930",
+        {
+            "input": {
+                "dropInstanceID": ...,  # drop claim_id
+            },
+        },
+    )),
+    # returns current state of points (balance, claim available) for a particular channel
+    ("ChannelPointsContext", (
+        "ChannelPointsContext",
+        "1530a003a7d374b0380b79db0be0534f30ff46e61cffa2bc0e2468a909fbc024",
+        {
+            "channelLogin": ...,  # channel login
+        },
+    )),
+    # returns all in-progress campaigns
+    ("Inventory", (
+        "Inventory",
+        "37fea486d6179047c41d0f549088a4c3a7dd60c05c70956a1490262f532dccd9",
+        # no variables needed
+        None,
+    )),
+    # returns current state of drops (current drop progress)
+    ("CurrentDrop", (
+        "DropCurrentSessionContext",
+        "2e4b3630b91552eb05b76a94b6850eb25fe42263b7cf6d06bee6d156dd247c1c",
+        # no variables needed
+        None,
+    )),
+    # returns all available campaigns
+    ("Campaigns", (
+        "ViewerDropsDashboard",
+        "8d5d9b5e3f088f9d1ff39eb2caab11f7a4cf7a3353da9ce82b5778226ff37268",
+        # no variables needed
+        None,
+    )),
+    # returns extended information about a particular campaign
+    ("CampaignDetails", (
+        "DropCampaignDetails",
+        "e5916665a37150808f8ad053ed6394b225d5504d175c7c0b01b9a89634c57136",
+        {
+            "channelLogin": ...,  # user login
+            "dropID": ...,  # campaign ID
+        },
+    )),
+    # returns drops available for a particular channel (unused)
+    ("AvailableDrops", (
+        "DropsHighlightService_AvailableDrops",
+        "9a62a09bce5b53e26e64a671e530bc599cb6aab1e5ba3cbd5d85966d3940716f",
+        {
+            "channelID": ...,  # channel ID as a str
+        },
+    )),
+    # returns live channels for a particular game
+    ("GameDirectory", (
+        "DirectoryPage_Game",
+        "3c9a94ee095c735e43ed3ad6ce6d4cbd03c4c6f754b31de54993e0d48fd54e30",
+        {
+            "limit": ...,  # limit of channels returned
+            "slug": ...,  # game slug
+            "imageWidth": 50,
+            "options": {
+                "broadcasterLanguages": [],
+                "freeformTags": None,
+                "includeRestricted": ["SUB_ONLY_LIVE"],
+                "recommendationsContext": {"platform": "web"},
+                "sort": "RELEVANCE",
+                "tags": [],
+                "requestID": "JIRA-VXP-2397",
+                "systemFilters": ["DROPS_ENABLED"],
+            },
+            "sortTypeIsRecency": False,
+        },
+    )),
+    ("NotificationsView", (  # unused, triggers notifications "update-summary"
+        "OnsiteNotifications_View",
+        "f6bdb1298f376539487f28b7f8a6b5d7434ec04ba4d7dc5c232b258410ae04d6",
+        {
+            "input": {},
+        },
+    )),
+    ("NotificationsList", (  # unused
+        "OnsiteNotifications_ListNotifications",
+        "e709b905ddb963d7cf4a8f6760148926ecbd0eee0f2edc48d1cf17f3e87f6490",
+        {
+            "cursor": "",
+            "displayType": "VIEWER",
+            "language": "en",
+            "limit": 10,
+            "shouldLoadLastBroadcast": False,
+        },
+    )),
+    ("NotificationsDelete", (
+        "OnsiteNotifications_DeleteNotification",
+        "13d463c831f28ffe17dccf55b3148ed8b3edbbd0ebadd56352f1ff0160616816",
+        {
+            "input": {
+                "id": ...,  # ID of the notification to delete
+            }
+        },
+    )),
+)
+_GQL_INDEX: abc.Mapping[str, tuple[str, str, JsonType | None]] = MappingProxyType(
+    dict(_GQL_SPECS)
+)
+_GQL_CACHE: dict[str, GQLOperation] = {}
+
+
+class _LazyGQLMap(abc.Mapping[str, GQLOperation]):
+    """
+    Read-only mapping of GQL operations, each one being built on first access only.
+    """
+    def __getitem__(self, key: str) -> GQLOperation:
+        try:
+            return _GQL_CACHE[key]
+        except KeyError:
+            pass
+        name, sha256, variables = _GQL_INDEX[key]
+        if variables is not None:
+            # keep the spec itself intact
+            variables = _copy_vars(variables)
+        operation = _GQL_CACHE[key] = GQLOperation(name, sha256, variables=variables)
+        return operation
+
+    def __contains__(self, key: object) -> bool:
+        return key in _GQL_INDEX
+
+    def __iter__(self) -> abc.Iterator[str]:
+        return iter(_GQL_INDEX)
+
+    def __len__(self) -> int:
+        return len(_GQL_INDEX)
+
+
+_GQL_OPERATIONS = _LazyGQLMap()
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 - lazily evaluated module attributes
+    if name == "GQL_OPERATIONS":
+        return _GQL_OPERATIONS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
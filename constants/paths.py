@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from collections import abc
+from typing import Any, TYPE_CHECKING
+
+
+# True if we're running from a built EXE (or a Linux AppImage), False inside a dev build
+IS_APPIMAGE = "APPIMAGE" in os.environ and os.path.exists(os.environ["APPIMAGE"])
+IS_PACKAGED = hasattr(sys, "_MEIPASS") or IS_APPIMAGE
+# site-packages venv path changes depending on the system platform
+# NOTE: On Linux, the site-packages path includes a versioned 'pythonX.Y' folder part,
+# and the Lib folder is also spelled in lowercase: 'lib'
+SYS_SITE_PACKAGES = (
+    "Lib/site-packages"
+    if sys.platform == "win32"
+    else f"lib/python{sys.version_info.major}.{sys.version_info.minor}/site-packages"
+)
+
+
+def _resource_path(relative_path: Path | str) -> Path:
+    """
+    Get an absolute path to a bundled resource.
+
+    Works for dev and for PyInstaller.
+    """
+    if IS_APPIMAGE:
+        base_path = Path(sys.argv[0]).absolute().parent
+    elif IS_PACKAGED:
+        # PyInstaller's folder where the one-file app is unpacked
+        meipass: str = getattr(sys, "_MEIPASS")
+        base_path = Path(meipass)
+    else:
+        base_path = WORKING_DIR
+    return base_path.joinpath(relative_path)
+
+
+# Base Paths
+if IS_APPIMAGE:
+    SELF_PATH = Path(os.environ["APPIMAGE"]).absolute()
+else:
+    # NOTE: pyinstaller will set sys.argv[0] to its own executable when building,
+    # detect this to use __file__ and main.py redirection instead
+    SELF_PATH = Path(sys.argv[0]).absolute()
+    if SELF_PATH.stem == "pyinstaller":
+        SELF_PATH = Path(__file__).parent.with_name("main.py").absolute()
+WORKING_DIR = SELF_PATH.parent
+_WD = str(WORKING_DIR)
+# Other paths are evaluated lazily on first access, see the module's __getattr__
+# NOTE: Except for LANG_PATH, these are plain strings - wrap them in a Path where needed
+_PATHS: dict[str, abc.Callable[[], Path | str]] = {
+    # Development paths
+    "VENV_PATH": lambda: os.path.join(_WD, "env"),
+    "SITE_PACKAGES_PATH": lambda: os.path.join(_WD, "env", SYS_SITE_PACKAGES),
+    # Translations path
+    # NOTE: These don't have to be available to the end-user,
+    # so the path points to the internal dir
+    "LANG_PATH": lambda: _resource_path("lang"),
+    # Other Paths
+    "LOG_PATH": lambda: os.path.join(_WD, "log.txt"),
+    "CACHE_PATH": lambda: os.path.join(_WD, "cache"),
+    "LOCK_PATH": lambda: os.path.join(_WD, "lock.file"),
+    "CACHE_DB": lambda: os.path.join(_WD, "cache", "mapping.json"),
+    "COOKIES_PATH": lambda: os.path.join(_WD, "cookies.jar"),
+    "SETTINGS_PATH": lambda: os.path.join(_WD, "settings.json"),
+}
+if TYPE_CHECKING:
+    VENV_PATH: str
+    SITE_PACKAGES_PATH: str
+    LANG_PATH: Path
+    LOG_PATH: str
+    CACHE_PATH: str
+    LOCK_PATH: str
+    CACHE_DB: str
+    COOKIES_PATH: str
+    SETTINGS_PATH: str
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 - lazily evaluated module attributes
+    if name in _PATHS:
+        # cache into the module's namespace, so that later accesses don't even get here
+        path = globals()[name] = _PATHS[name]()
+        return path
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import Literal, TYPE_CHECKING
+
+from . import MAX_TOPICS
+
+if TYPE_CHECKING:
+    from collections import abc
+
+    from . import JsonType, TopicProcess
+
+
+# (category, topic_name, target_id) -> topic, reused when the same topic is created again
+_TOPIC_POOL: dict[tuple[str, str, int], WebsocketTopic] = {}
+_TOPIC_POOL_LIMIT = MAX_TOPICS * 2
+
+
+class WebsocketTopic:
+    __slots__ = ("_id", "_target_id", "_process", "_hash")
+
+    def __new__(
+        cls,
+        category: Literal["User", "Channel"],
+        topic_name: str,
+        target_id: int,
+        process: TopicProcess,
+    ) -> WebsocketTopic:
+        key = (category, topic_name, target_id)
+        self = _TOPIC_POOL.get(key)
+        if self is not None:
+            self._process = process
+            return self
+        assert isinstance(target_id, int)
+        self = super().__new__(cls)
+        self._id = sys.intern(cls.as_str(category, topic_name, target_id))
+        self._target_id = target_id
+        self._process = process
+        # NOTE: topic strings are unique on their own, as __eq__ already type-checks
+        self._hash = hash(self._id)
+        if len(_TOPIC_POOL) >= _TOPIC_POOL_LIMIT:
+            # evict the oldest entry
+            del _TOPIC_POOL[next(iter(_TOPIC_POOL))]
+        _TOPIC_POOL[key] = self
+        return self
+
+    @staticmethod
+    def clear_pool() -> None:
+        _TOPIC_POOL.clear()
+
+    @classmethod
+    def as_str(
+        cls, category: Literal["User", "Channel"], topic_name: str, target_id: int
+    ) -> str:
+        return f"{_TOPIC_PREFIX[(category, topic_name)]}.{target_id}"
+
+    def __call__(self, message: JsonType):
+        return self._process(self._target_id, message)
+
+    def __str__(self) -> str:
+        return self._id
+
+    def __repr__(self) -> str:
+        return f"Topic({self._id})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, WebsocketTopic):
+            return self._id == other._id
+        elif isinstance(other, str):
+            return self._id == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+_WEBSOCKET_TOPICS: dict[str, dict[str, str]] = {
+    "User": {  # Using user_id
+        "Presence": "presence",  # unused
+        "Drops": "user-drop-events",
+        "Notifications": "onsite-notifications",
+        "CommunityPoints": "community-points-user-v1",
+    },
+    "Channel": {  # Using channel_id
+        "Drops": "channel-drop-events",  # unused
+        "StreamState": "video-playback-by-id",
+        "StreamUpdate": "broadcast-settings-update",
+        "CommunityPoints": "community-points-channel-v1",  # unused
+    },
+}
+# read-only views, as the topics never change at runtime
+WEBSOCKET_TOPICS: abc.Mapping[str, abc.Mapping[str, str]] = MappingProxyType(
+    {category: MappingProxyType(topics) for category, topics in _WEBSOCKET_TOPICS.items()}
+)
+# flattened (category, topic_name) -> prefix table, for fast topic string construction
+_TOPIC_PREFIX: dict[tuple[str, str], str] = {
+    (category, topic_name): prefix
+    for category, topics in WEBSOCKET_TOPICS.items()
+    for topic_name, prefix in topics.items()
+}
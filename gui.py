@@ -34,7 +34,7 @@ from cache import ImageCache
 from exceptions import ExitRequest
 from utils import resource_path, set_root_icon, webopen, Game, _T
 from constants import (
-    SELF_PATH, OUTPUT_FORMATTER, WS_TOPICS_LIMIT, MAX_WEBSOCKETS, WINDOW_TITLE, State
+    SELF_PATH, OUTPUT_FORMATTER, WS_TOPICS_LIMIT, MAX_WEBSOCKETS, WINDOW_TITLE, State, state_name
 )
 if sys.platform == "win32":
     from registry import RegistryKey, ValueType
@@ -2428,7 +2428,7 @@ if __name__ == "__main__":
                 tray_notifications=True
             )
         )
-        mock.change_state = lambda state: mock.gui.print(f"State change: {state.value}")
+        mock.change_state = lambda state: mock.gui.print(f"State change: {state_name(state)}")
         mock.state_change = lambda state: partial(mock.change_state, state)
         mock.request = aiohttp.request
         gui = GUIManager(mock)  # type: ignore
@@ -152,9 +152,7 @@ class BaseDrop:
         if not self.can_claim:
             return False
         response = await self._twitch.gql_request(
-            GQL_OPERATIONS["ClaimDrop"].with_variables(
-                {"input": {"dropInstanceID": self.claim_id}}
-            )
+            GQL_OPERATIONS["ClaimDrop"].render(dropInstanceID=self.claim_id)
         )
         data = response["data"]
         if "errors" in data and data["errors"]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import re
 import sys
 import json
@@ -616,7 +617,7 @@ class Twitch:
     def __init__(self, settings: Settings):
         self.settings: Settings = settings
         # State management
-        self._state: State = State.IDLE
+        self._state: int = State.IDLE
         self._state_change = asyncio.Event()
         self.wanted_games: dict[Game, int] = {}
         self.inventory: list[DropsCampaign] = []
@@ -647,7 +648,7 @@ class Twitch:
         # load in cookies
         cookie_jar = aiohttp.CookieJar()
         try:
-            if COOKIES_PATH.exists():
+            if os.path.exists(COOKIES_PATH):
                 cookie_jar.load(COOKIES_PATH)
         except Exception:
             # if loading in the cookies file ends up in an error, just ignore it
@@ -704,13 +705,13 @@ class Twitch:
     def wait_until_login(self) -> abc.Coroutine[Any, Any, Literal[True]]:
         return self._auth_state._logged_in.wait()
 
-    def change_state(self, state: State) -> None:
-        if self._state is not State.EXIT:
+    def change_state(self, state: int) -> None:
+        if self._state != State.EXIT:
             # prevent state changing once we switch to exit state
             self._state = state
         self._state_change.set()
 
-    def state_change(self, state: State) -> abc.Callable[[], None]:
+    def state_change(self, state: int) -> abc.Callable[[], None]:
         # this is identical to change_state, but defers the call
         # perfect for GUI usage
         return partial(self.change_state, state)
@@ -806,12 +807,12 @@ class Twitch:
         channels: Final[OrderedDict[int, Channel]] = self.channels
         self.change_state(State.INVENTORY_FETCH)
         while True:
-            if self._state is State.IDLE:
+            if self._state == State.IDLE:
                 self.gui.status.update(_("gui", "status", "idle"))
                 self.stop_watching()
                 # clear the flag and wait until it's set again
                 self._state_change.clear()
-            elif self._state is State.INVENTORY_FETCH:
+            elif self._state == State.INVENTORY_FETCH:
                 # ensure the websocket is running
                 await self.websocket.start()
                 await self.fetch_inventory()
@@ -819,7 +820,7 @@ class Twitch:
                 # Save state on every inventory fetch
                 self.save()
                 self.change_state(State.GAMES_UPDATE)
-            elif self._state is State.GAMES_UPDATE:
+            elif self._state == State.GAMES_UPDATE:
                 # claim drops from expired and active campaigns
                 for campaign in self.inventory:
                     if not campaign.upcoming:
@@ -847,7 +848,7 @@ class Twitch:
                 full_cleanup = True
                 self.restart_watching()
                 self.change_state(State.CHANNELS_CLEANUP)
-            elif self._state is State.CHANNELS_CLEANUP:
+            elif self._state == State.CHANNELS_CLEANUP:
                 self.gui.status.update(_("gui", "status", "cleanup"))
                 if not self.wanted_games or full_cleanup:
                     # no games selected or we're doing full cleanup: remove everything
@@ -887,7 +888,7 @@ class Twitch:
                     # with no games available, we switch to IDLE after cleanup
                     self.print(_("status", "no_campaign"))
                     self.change_state(State.IDLE)
-            elif self._state is State.CHANNELS_FETCH:
+            elif self._state == State.CHANNELS_FETCH:
                 self.gui.status.update(_("gui", "status", "gathering"))
                 # start with all current channels, clear the memory and GUI
                 new_channels: OrderedSet[Channel] = OrderedSet(channels.values())
@@ -993,7 +994,7 @@ class Twitch:
                     ordered_channels,
                     watching_channel,
                 )
-            elif self._state is State.CHANNEL_SWITCH:
+            elif self._state == State.CHANNEL_SWITCH:
                 self.gui.status.update(_("gui", "status", "switching"))
                 # Change into the selected channel, stay in the watching channel,
                 # or select a new channel that meets the required conditions
@@ -1029,7 +1030,7 @@ class Twitch:
                     self.print(_("status", "no_channel"))
                     self.change_state(State.IDLE)
                 del new_watching, selected_channel, watching_channel
-            elif self._state is State.EXIT:
+            elif self._state == State.EXIT:
                 self.gui.status.update(_("gui", "status", "exiting"))
                 # we've been requested to exit the application
                 break
@@ -1410,9 +1411,7 @@ class Twitch:
             if data["type"] == "user_drop_reward_reminder_notification":
                 self.change_state(State.INVENTORY_FETCH)
                 await self.gql_request(
-                    GQL_OPERATIONS["NotificationsDelete"].with_variables(
-                        {"input": {"id": data["id"]}}
-                    )
+                    GQL_OPERATIONS["NotificationsDelete"].render(id=data["id"])
                 )
 
     @task_wrapper
@@ -1525,26 +1524,38 @@ class Twitch:
                 await asyncio.wait_for(self.gui.wait_until_closed(), timeout=delay)
 
     @overload
-    async def gql_request(self, ops: GQLOperation) -> JsonType:
+    async def gql_request(self, ops: GQLOperation | bytes) -> JsonType:
         ...
 
     @overload
-    async def gql_request(self, ops: list[GQLOperation]) -> list[JsonType]:
+    async def gql_request(self, ops: list[GQLOperation | bytes]) -> list[JsonType]:
         ...
 
     async def gql_request(
-        self, ops: GQLOperation | list[GQLOperation]
+        self, ops: GQLOperation | bytes | list[GQLOperation | bytes]
     ) -> JsonType | list[JsonType]:
-        gql_logger.debug(f"GQL Request: {ops}")
+        # operations can be passed in already rendered, see GQLOperation.render
+        body: bytes
+        if isinstance(ops, list):
+            body = b"[" + b",".join(
+                op if isinstance(op, bytes) else op.render() for op in ops
+            ) + b"]"
+        elif isinstance(ops, bytes):
+            body = ops
+        else:
+            body = ops.render()
+        gql_logger.debug(f"GQL Request: {body.decode()}")
         backoff = ExponentialBackoff(maximum=60)
         for delay in backoff:
             try:
                 auth_state = await self.get_auth()
+                headers = auth_state.headers(user_agent=self._client_type.USER_AGENT, gql=True)
+                headers["Content-Type"] = "application/json"
                 async with self.request(
                     "POST",
                     "https://gql.twitch.tv/gql",
-                    json=ops,
-                    headers=auth_state.headers(user_agent=self._client_type.USER_AGENT, gql=True),
+                    data=body,
+                    headers=headers,
                     invalidate_after=getattr(auth_state, "integrity_expires", None),
                 ) as response:
                     response_json: JsonType | list[JsonType] = await response.json()
@@ -1607,8 +1618,8 @@ class Twitch:
         auth_state = await self.get_auth()
         response_list: list[JsonType] = await self.gql_request(
             [
-                GQL_OPERATIONS["CampaignDetails"].with_variables(
-                    {"channelLogin": str(auth_state.user_id), "dropID": cid}
+                GQL_OPERATIONS["CampaignDetails"].render(
+                    channelLogin=str(auth_state.user_id), dropID=cid
                 )
                 for cid in campaign_ids
             ]
@@ -1734,14 +1745,7 @@ class Twitch:
     async def get_live_streams(self, game: Game, *, limit: int = 30) -> list[Channel]:
         try:
             response = await self.gql_request(
-                GQL_OPERATIONS["GameDirectory"].with_variables({
-                    "limit": limit,
-                    "slug": game.slug,
-                    "options": {
-                        "includeRestricted": ["SUB_ONLY_LIVE"],
-                        "systemFilters": ["DROPS_ENABLED"],
-                    },
-                })
+                GQL_OPERATIONS["GameDirectory"].render(limit=limit, slug=game.slug)
             )
         except MinerException as exc:
             raise MinerException(f"Game: {game.slug}") from exc
@@ -1754,7 +1758,7 @@ class Twitch:
 
     async def claim_points(self, channel_id: str | int, claim_id: str) -> None:
         await self.gql_request(
-            GQL_OPERATIONS["ClaimCommunityPoints"].with_variables(
-                {"input": {"channelID": str(channel_id), "claimID": claim_id}}
+            GQL_OPERATIONS["ClaimCommunityPoints"].render(
+                channelID=str(channel_id), claimID=claim_id
             )
         )
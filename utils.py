@@ -80,15 +80,15 @@ def format_traceback(exc: BaseException, **kwargs: Any) -> str:
     return ''.join(traceback.format_exception(type(exc), exc, **kwargs))
 
 
-def lock_file(path: Path) -> tuple[bool, io.TextIOWrapper]:
-    file = path.open('w', encoding="utf8")
+def lock_file(path: Path | str) -> tuple[bool, io.TextIOWrapper]:
+    file = open(path, 'w', encoding="utf8")
     file.write('ツ')
     file.flush()
     if sys.platform == "win32":
         import msvcrt
         try:
             # we need to lock at least one byte for this to work
-            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, max(path.stat().st_size, 1))
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, max(os.stat(path).st_size, 1))
         except Exception:
             return False, file
         return True, file
@@ -228,9 +228,9 @@ def merge_json(obj: JsonType, template: Mapping[Any, Any]) -> None:
             obj[k] = template[k]
 
 
-def json_load(path: Path, defaults: _JSON_T, *, merge: bool = True) -> _JSON_T:
+def json_load(path: Path | str, defaults: _JSON_T, *, merge: bool = True) -> _JSON_T:
     defaults_dict: JsonType = dict(defaults)
-    if path.exists():
+    if os.path.exists(path):
         with open(path, 'r', encoding="utf8") as file:
             combined: JsonType = _remove_missing(json.load(file, object_hook=_deserialize))
         if merge:
@@ -240,7 +240,7 @@ def json_load(path: Path, defaults: _JSON_T, *, merge: bool = True) -> _JSON_T:
     return cast(_JSON_T, combined)
 
 
-def json_save(path: Path, contents: Mapping[Any, Any], *, sort: bool = False) -> None:
+def json_save(path: Path | str, contents: Mapping[Any, Any], *, sort: bool = False) -> None:
     with open(path, 'w', encoding="utf8") as file:
         json.dump(contents, file, default=_serialize, sort_keys=sort, indent=4)
 